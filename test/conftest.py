@@ -24,12 +24,20 @@ def pytest_addoption(parser):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def auth_token_file(request):
     """Create pytest fixture to return auth token file from the command line arg"""
     return request.config.getoption("--auth_token_file")
 
 
+@pytest.fixture(scope="session")
+def dx_auth(auth_token_file):
+    """Set the dxpy authentication token read from the command line file once per session"""
+    with open(auth_token_file) as f:
+        auth_token = f.read().rstrip()
+    dxpy.set_security_context({"auth_token_type": "Bearer", "auth_token": auth_token})
+
+
 @pytest.fixture(scope="session")
 def data_test_runfolders():
     """A fixture that returns a list of tuples containing (runfolder_name, fastq_list_file)."""
@@ -45,42 +53,36 @@ def data_test_runfolders():
     ]
 
 
-@pytest.fixture(scope="function", autouse=True)
-def create_test_dirs(data_test_runfolders, auth_token_file, request, monkeypatch):
+@pytest.fixture(scope="session", autouse=True)
+def create_test_dirs(data_test_runfolders, dx_auth):
     """Create test data for testing.
 
-    This is an autouse fixture with session function, meaning it is run once per test
+    This is an autouse fixture with session scope, meaning it is run once per test session.
+    Tests must not delete the test runfolders (test_delete monkeypatches the delete call).
     """
     for runfolder_name, fastq_list_file in data_test_runfolders:
         # Create the runfolder directory as per Illumina spec
         runfolder_path = os.path.join(DATA_DIR, runfolder_name)
-        fastqs_path = os.path.join(
-            PROJECT_DIR, f"{runfolder_path}/Data/Intensities/BaseCalls"
-        )
-        Path(fastqs_path).mkdir(parents=True, exist_ok=True)
+        fastqs_path = os.path.join(runfolder_path, "Data", "Intensities", "BaseCalls")
+        os.makedirs(fastqs_path, exist_ok=True)
         # Create dummy logfile
         # open(upload_runfolder_logfile, 'w').close()
-        # Generate empty fastqfiles in runfolder
+        # Generate empty fastqfiles in runfolder, skipping any left by a previous session
+        existing_fastqs = {entry.name for entry in os.scandir(fastqs_path)}
         with open(fastq_list_file) as f:
             fastq_list = f.read().splitlines()
-            for fastq_file in fastq_list:
-                Path(fastqs_path, fastq_file).touch(mode=777, exist_ok=True)
+        for fastq_file in fastq_list:
+            if fastq_file not in existing_fastqs:
+                os.close(os.open(os.path.join(fastqs_path, fastq_file), os.O_WRONLY | os.O_CREAT, 0o666))
         open(
             os.path.join(runfolder_path, "RTAComplete.txt"), "w"
         ).close()  # Create RTAComplete file
         open(
             f"{runfolder_path}_upload_runfolder.log", "w"
         ).close()  # Create dummy upload runfolder log file
-        with open(
-            auth_token_file
-        ) as f:  # Setup dxpy authentication token read from command line file
-            auth_token = f.read().rstrip()
-        dxpy.set_security_context(
-            {"auth_token_type": "Bearer", "auth_token": auth_token}
-        )
 
     yield  # Where the testing happens
-    # TEARDOWN - cleanup after each test
+    # TEARDOWN - cleanup after the test session
     for runfolder_name, fastq_list_file in data_test_runfolders:
         runfolder_path = os.path.join(PROJECT_DIR, f"test/data/{runfolder_name}")
-        shutil.rmtree(runfolder_path)
+        shutil.rmtree(runfolder_path, ignore_errors=True)
@@ -1,7 +1,9 @@
+import re
 import pytest
 from pathlib import Path
-import shutil
+from types import SimpleNamespace
 import wscleaner.wscleaner as wscleaner
+from wscleaner.__main__ import check_runfolder
 
 
 test_data_dir = Path(str(Path(__file__).parent), "data")
@@ -39,6 +41,56 @@ def rfm_dry(monkeypatch):
     return wscleaner.RunFolderManager(str(test_data_dir), dry_run=True)
 
 
+class TestReadLastLine:
+    @pytest.mark.parametrize(
+        "contents, last_line",
+        [
+            (b"", b""),
+            (b"first line\nTSO500 run.", b"TSO500 run."),
+            (b"first line\r\nTSO500 run.\r\n", b"TSO500 run.\r\n"),
+            (b"first line\n" + b"x" * 50 + b"\n", b"x" * 50 + b"\n"),
+            (b"y" * 50, b"y" * 50),
+        ],
+        ids=["empty", "no_trailing_newline", "crlf", "longer_than_block", "single_line_longer_than_block"],
+    )
+    def test_read_last_line(self, tmp_path, contents, last_line):
+        """test that the last line is returned when reading backwards in blocks smaller than the line"""
+        filepath = tmp_path / "bcl2fastq2_output.log"
+        filepath.write_bytes(contents)
+        assert wscleaner._read_last_line(str(filepath), block_size=8) == last_line
+
+
+class TestParallelRmtree:
+    def test_removes_tree(self, tmp_path):
+        """test that nested directories and files are deleted, and an inner symlink is removed without
+        deleting its target"""
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        (outside / "keep.txt").write_text("keep")
+        root = tmp_path / "runfolder"
+        nested = root / "Data" / "Intensities" / "BaseCalls"
+        nested.mkdir(parents=True)
+        for i in range(20):
+            (nested / f"sample_{i}.fastq.gz").write_text("")
+        (root / "RTAComplete.txt").write_text("")
+        (root / "Data" / "link").symlink_to(outside, target_is_directory=True)
+        wscleaner._parallel_rmtree(str(root))
+        assert not root.exists()
+        assert (outside / "keep.txt").read_text() == "keep"
+
+    def test_symlinked_root(self, tmp_path):
+        """test that a symlinked root raises an error and its target is left untouched"""
+        target = tmp_path / "target"
+        target.mkdir()
+        (target / "keep.txt").write_text("keep")
+        link = tmp_path / "link"
+        link.symlink_to(target, target_is_directory=True)
+        with pytest.raises(OSError):
+            wscleaner._parallel_rmtree(str(link))
+        assert link.is_symlink()
+        assert (target / "keep.txt").read_text() == "keep"
+
+
 class TestRunFolder:
     def test_runfolders_ready(self, data_test_runfolders, rfm):
         """Test that runfolders in the test directory pass checks for deletion. Est. 20 seconds."""
@@ -61,6 +113,42 @@ class TestRunFolder:
             assert len(rf.find_fastqs()) == test_folder_fastqs
             assert len(rf.dx_project.find_fastqs()) == test_folder_fastqs
 
+    def test_has_fastqs(self, data_test_runfolders):
+        """Tests that runfolders containing fastqs are identified without listing every fastq"""
+        for runfolder_name, fastq_list_file in data_test_runfolders:
+            rf = wscleaner.RunFolder(Path("test/data", runfolder_name))
+            assert rf.has_fastqs()
+
+    def test_unreadable_directory(self, monkeypatch, tmp_path):
+        """test that a directory which cannot be listed is not treated as a completed runfolder"""
+        runfolder_path = tmp_path / "999999_NB551068_1234_UNREADABLE"
+        runfolder_path.mkdir()
+        (runfolder_path / "RTAComplete.txt").write_text("")
+
+        def scandir_denied(path):
+            raise PermissionError(13, "Permission denied", path)
+
+        monkeypatch.setattr(wscleaner.os, "scandir", scandir_denied)
+        rf = wscleaner.RunFolder(str(runfolder_path))
+        assert not rf.RTA_complete_exists
+
+    def test_find_fastqs_vanished_directory(self, monkeypatch, tmp_path):
+        """test that a subdirectory removed during the fastq search is skipped"""
+        runfolder_path = tmp_path / "999999_NB551068_1234_VANISHED"
+        (runfolder_path / "Data" / "Intensities" / "BaseCalls").mkdir(parents=True)
+        (runfolder_path / "Data" / "Intensities" / "BaseCalls" / "sample.fastq.gz").write_text("")
+        (runfolder_path / "Thumbnail_Images").mkdir()
+        rf = wscleaner.RunFolder(str(runfolder_path))
+        scandir = wscleaner.os.scandir
+
+        def scandir_vanished(path):
+            if path.endswith("Thumbnail_Images"):
+                raise FileNotFoundError(2, "No such file or directory", path)
+            return scandir(path)
+
+        monkeypatch.setattr(wscleaner.os, "scandir", scandir_vanished)
+        assert rf.find_fastqs() == ["sample.fastq.gz"]
+
     def test_min_age(self, rfm):
         """test that the runfolder age function records age"""
         runfolders = rfm.find_runfolders(min_age=10)
@@ -68,8 +156,47 @@ class TestRunFolder:
         assert all([rf.age > 10 for rf in runfolders])
 
 
-# TODO add a class to test the DxProjectRunFolder class
-# class TestDxProjectRunFolder:
+class TestDxProjectRunFolder:
+    @pytest.fixture
+    def find_projects_calls(self, monkeypatch):
+        """Replace dxpy.find_projects with a search of set DNAnexus project names. Returns the list of
+        searched name patterns."""
+        project_names = ["002_999999_A_ONE", "002_999999_A_TWO", "003_999999_A_TWO"] + [
+            f"002_999999_B_{i}" for i in range(5)
+        ]
+        calls = []
+
+        def find_projects(name, name_mode, describe):
+            calls.append(name)
+            return (
+                {"id": f"project-{index}", "describe": {"name": project_name}}
+                for index, project_name in enumerate(project_names)
+                if re.search(name, project_name)
+            )
+
+        monkeypatch.setattr(wscleaner.dxpy, "find_projects", find_projects)
+        return calls
+
+    def test_find_projects(self, find_projects_calls):
+        """test that runfolders matching one project get its id and name, and runfolders matching zero or
+        more than one project get no project"""
+        dx_projects = wscleaner.DxProjectRunFolder.find_projects(["999999_A_ONE", "999999_A_NONE", "999999_A_TWO"])
+        assert len(find_projects_calls) == 1
+        assert dx_projects["999999_A_ONE"]
+        assert dx_projects["999999_A_ONE"].id == "project-0"
+        assert dx_projects["999999_A_ONE"].name == "002_999999_A_ONE"
+        assert not dx_projects["999999_A_NONE"]
+        assert dx_projects["999999_A_NONE"].id is None
+        assert not dx_projects["999999_A_TWO"]
+        assert dx_projects["999999_A_TWO"].id is None
+
+    def test_find_projects_batches(self, monkeypatch, find_projects_calls):
+        """test that runfolder names are searched in batches of PROJECT_SEARCH_BATCH_SIZE"""
+        monkeypatch.setattr(wscleaner, "PROJECT_SEARCH_BATCH_SIZE", 2)
+        runfolder_names = [f"999999_B_{i}" for i in range(5)]
+        dx_projects = wscleaner.DxProjectRunFolder.find_projects(runfolder_names)
+        assert find_projects_calls == ["999999_B_0|999999_B_1", "999999_B_2|999999_B_3", "999999_B_4"]
+        assert [dx_projects[name].name for name in runfolder_names] == [f"002_{name}" for name in runfolder_names]
 
 
 class TestRunfolderManager:
@@ -90,12 +217,73 @@ class TestRunfolderManager:
         Here, the pytest monkeypatch fixture is used to overwrite the delete function and persist the test directories.
         """
         test_folder = rfm.find_runfolders(min_age=0)[0]
-        monkeypatch.setattr(shutil, "rmtree", lambda x: "TEST_DELETED")
+        monkeypatch.setattr(wscleaner, "_parallel_rmtree", lambda x: "TEST_DELETED")
         rfm.delete(test_folder)
         assert test_folder.name in rfm.deleted
 
+    def test_check_upload_log(self, monkeypatch, tmp_path, rfm):
+        """test that an upload log containing an ERROR log fails the upload log check, and a missing upload log
+        returns None"""
+        test_folder = rfm.find_runfolders(min_age=0)[0]
+        assert rfm.check_upload_log(test_folder)
+        monkeypatch.setattr(wscleaner, "upload_runfolder_logdir", tmp_path)
+        assert rfm.check_upload_log(test_folder) is None
+        Path(tmp_path, f"{test_folder.name}_upload_runfolder.log").write_text(
+            "2023-01-01 00:00:00 - INFO - upload started\n2023-01-01 00:00:01 - ERROR - upload failed\n"
+        )
+        assert not rfm.check_upload_log(test_folder)
+
     def test_dry_run(self, rfm_dry):
         """test that the dry_run option does not cause the test directory to be deleted"""
         test_folder = rfm_dry.find_runfolders(min_age=0)[0]
         rfm_dry.delete(test_folder)
         assert test_folder.name not in rfm_dry.deleted
+
+
+class StubRunFolderManager:
+    """Runfolder manager returning set check results and recording which checks were called"""
+
+    def __init__(self, upload_log=True, logfiles=True, fastqs=True):
+        self.results = {"check_upload_log": upload_log, "check_logfiles": logfiles, "check_fastqs": fastqs}
+        self.calls = []
+
+    def check_upload_log(self, runfolder):
+        self.calls.append("check_upload_log")
+        return self.results["check_upload_log"]
+
+    def check_logfiles(self, runfolder, logfile_count):
+        self.calls.append("check_logfiles")
+        return self.results["check_logfiles"]
+
+    def check_fastqs(self, runfolder):
+        self.calls.append("check_fastqs")
+        return self.results["check_fastqs"]
+
+
+class TestCheckRunfolder:
+    @pytest.mark.parametrize(
+        "dx_project, checks, failed_check, calls",
+        [
+            (True, {}, None, ["check_upload_log", "check_logfiles", "check_fastqs"]),
+            (False, {}, "DX PROJECT MISMATCH", []),
+            (True, {"upload_log": None}, "UPLOAD LOG MISSING", ["check_upload_log"]),
+            (True, {"upload_log": False}, "UPLOAD LOG CONTAINS ERRORS", ["check_upload_log"]),
+            (True, {"logfiles": False}, "LOGFILE MISMATCH", ["check_upload_log", "check_logfiles"]),
+            (True, {"fastqs": False}, "FASTQ MISMATCH", ["check_upload_log", "check_logfiles", "check_fastqs"]),
+        ],
+    )
+    def test_check_order(self, dx_project, checks, failed_check, calls):
+        """test that checks run cheapest first and stop at the first failure. A missing or failed upload log
+        means DNAnexus is not queried."""
+        runfolder = SimpleNamespace(name="999999_NB551068_1234_STUB", dx_project=dx_project)
+        rfm = StubRunFolderManager(**checks)
+        assert check_runfolder(runfolder, rfm, 6) == failed_check
+        assert rfm.calls == calls
+
+    @pytest.mark.parametrize("dx_project, failed_check", [(True, None), (False, "DX PROJECT MISMATCH")])
+    def test_minimal_check_level(self, dx_project, failed_check):
+        """test that the minimal check level only checks for a DNAnexus project"""
+        runfolder = SimpleNamespace(name="999999_NB551068_1234_STUB", dx_project=dx_project)
+        rfm = StubRunFolderManager(upload_log=None, logfiles=False, fastqs=False)
+        assert check_runfolder(runfolder, rfm, 6, check_level="minimal") == failed_check
+        assert rfm.calls == []
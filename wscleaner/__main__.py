@@ -13,6 +13,7 @@ from pathlib import Path
 import datetime
 import argparse
 import logging
+from concurrent.futures import ThreadPoolExecutor
 import dxpy
 from wscleaner import mokaguys_logger
 from wscleaner.wscleaner import RunFolderManager
@@ -28,17 +29,26 @@ def git_tag() -> str:
         :return (str):  Git tag
     """
     filepath = os.path.dirname(os.path.realpath(__file__))
-    cmd = f"git -C {filepath} describe --tags"
-
-    proc = subprocess.Popen(
-        [cmd],
-        stderr=subprocess.PIPE,
+    # Run git directly rather than through a shell, so the path is passed as a single argument
+    proc = subprocess.run(
+        ["git", "-C", filepath, "describe", "--tags"],
+        stderr=subprocess.DEVNULL,
         stdout=subprocess.PIPE,
-        shell=True,
+        check=False,
     )
-    out, _ = proc.communicate()
     #  Return standard out, removing any new line characters
-    return out.rstrip().decode("utf-8")
+    return proc.stdout.rstrip().decode("utf-8")
+
+
+class VersionAction(argparse.Action):
+    """Print the version and exit. The git tag is only looked up when --version is given, rather than on every run"""
+
+    def __init__(self, option_strings, dest=argparse.SUPPRESS, default=argparse.SUPPRESS, help=None):
+        super().__init__(option_strings=option_strings, dest=dest, default=default, nargs=0, help=help)
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        print(f"wscleaner v{git_tag()}")
+        parser.exit()
 
 
 def cli_parser():
@@ -81,66 +91,108 @@ def cli_parser():
         type=int,
         default=6,
     )
+    parser.add_argument(
+        "--threads",
+        help="The number of runfolders to check concurrently",
+        type=int,
+        default=16,
+    )
+    parser.add_argument(
+        "--check-level",
+        help="Checks to run on each runfolder. 'minimal' only checks for a DNAnexus project and requires --dry-run",
+        choices=["full", "minimal"],
+        default="full",
+    )
     parser.add_argument(
         "--version",
         help="Print version",
-        action="version",
-        version=f"wscleaner v{version}",
+        action=VersionAction,
     )
-    return parser.parse_args()
-
-
-version = git_tag()
-# Parse CLI arguments. Some arguments will exit the program intentionally. See docstring for detail.
-args = cli_parser()
-LOGFILE = os.path.join(
-    args.log_dir, f"{TIMESTAMP}_wscleaner.log"
-)  # Path for the application logfile
-
-# Setup logging for module. Submodules inherit log handlers and filters
-mokaguys_logger.log_setup(LOGFILE)
-logger = logging.getLogger()
-# Set the name of the root logger
-logger.name = 'wscleaner'
-logger.info("START")
-
-# Setup dxpy authentication token read from command line file.
-with open(args.auth_token_file) as f:
-    auth_token = f.read().rstrip()
-dxpy.set_security_context({"auth_token_type": "Bearer", "auth_token": auth_token})
-
-# Set root directory and search it for runfolders
-# If dry-run CLI flag is given, no directories are deleted by the runfolder manager.
-RFM = RunFolderManager(args.runfolders_dir, dry_run=args.dry_run)
-logger.info(f"Runfolder directory {args.runfolders_dir}")
-logger.info("Identifying local runfolders to consider deleting")
-local_runfolders = RFM.find_runfolders(min_age=args.min_age)
-logger.info(
-    f"Found local runfolders to consider deleting: {[rf.name for rf in local_runfolders]}"
-)
-
-for runfolder in local_runfolders:
-    logger.info(f"Processing {runfolder.name}")
-    # Delete runfolder if it meets the backup criteria
-    # runfolder.dx_project is evaluated first as following criteria checks depend on it
-    if runfolder.dx_project:
-        fastqs_uploaded = RFM.check_fastqs(runfolder)
-        logfiles_uploaded = RFM.check_logfiles(runfolder, args.logfile_count)
-        upload_log_exists = RFM.upload_log_exists(runfolder)
-        if fastqs_uploaded and logfiles_uploaded:
-            RFM.delete(runfolder)
-        else:
-            if not fastqs_uploaded:
-                logger.warning(f"{runfolder.name} - FASTQ MISMATCH")
-            if not logfiles_uploaded:
-                logger.warning(f"{runfolder.name} - LOGFILE MISMATCH")
-            if not upload_log_exists:
-                logger.warning(f"{runfolder.name} - UPLOAD LOG MISSING")
+    args = parser.parse_args()
+    if args.threads < 1:
+        parser.error("--threads must be at least 1")
+    # Minimal checks are not enough to show a runfolder is safe to delete
+    if args.check_level == "minimal" and not args.dry_run:
+        parser.error("--check-level minimal can only be used with --dry-run")
+    return args
+
+
+def check_runfolder(runfolder, rfm, logfile_count, check_level="full"):
+    """Check a runfolder against the deletion criteria. Runs in a worker thread.
+    Checks run cheapest first and stop at the first failure, so local upload log checks are made before
+    DNAnexus is queried, and the small logfile query is made before the fastq listing.
+        :param runfolder (RunFolder):           Runfolder to check
+        :param rfm (RunFolderManager):          Runfolder manager used to run the checks
+        :param logfile_count (int):             Number of logfiles expected in the DNAnexus project
+        :param check_level (str):               'full' runs all checks, 'minimal' only checks for a DNAnexus project
+        :return (str | None):                   Description of the first failed check, or None if all checks pass
+    """
+    # runfolder.dx_project was found by find_runfolders. It is evaluated first as the DNAnexus checks depend on it
+    if not runfolder.dx_project:
+        return "DX PROJECT MISMATCH"
+    if check_level == "minimal":
+        return None
+    upload_log_bool = rfm.check_upload_log(runfolder)
+    if upload_log_bool is None:
+        return "UPLOAD LOG MISSING"
+    if not upload_log_bool:
+        return "UPLOAD LOG CONTAINS ERRORS"
+    if not rfm.check_logfiles(runfolder, logfile_count):
+        return "LOGFILE MISMATCH"
+    if not rfm.check_fastqs(runfolder):
+        return "FASTQ MISMATCH"
+    return None
+
+
+def main():
+    """Process the runfolders directory, deleting runfolders that have been uploaded to DNAnexus"""
+    # Parse CLI arguments. Some arguments will exit the program intentionally. See docstring for detail.
+    args = cli_parser()
+    logfile = os.path.join(
+        args.log_dir, f"{TIMESTAMP}_wscleaner.log"
+    )  # Path for the application logfile
+
+    # Setup logging for module. Submodules inherit log handlers and filters
+    mokaguys_logger.log_setup(logfile)
+    logger = logging.getLogger()
+    # Set the name of the root logger
+    logger.name = 'wscleaner'
+    logger.info("START")
+
+    # Setup dxpy authentication token read from command line file.
+    auth_token = Path(args.auth_token_file).read_text().strip()
+    dxpy.set_security_context({"auth_token_type": "Bearer", "auth_token": auth_token})
+
+    # Set root directory and search it for runfolders
+    # If dry-run CLI flag is given, no directories are deleted by the runfolder manager.
+    RFM = RunFolderManager(args.runfolders_dir, dry_run=args.dry_run)
+    logger.info("Runfolder directory %s", args.runfolders_dir)
+    logger.info("Identifying local runfolders to consider deleting")
+    local_runfolders = RFM.find_runfolders(min_age=args.min_age, threads=args.threads)
+    logger.info("Found local runfolders to consider deleting: %s", [rf.name for rf in local_runfolders])
+
+    # The DNAnexus checks for each runfolder are network bound, so they run concurrently in worker threads.
+    # Results are returned in runfolder order. Runfolders passing the checks are deleted once all checks are
+    # complete, one at a time. Each deletion unlinks its files from its own thread pool.
+    runfolders_to_delete = []
+    with ThreadPoolExecutor(max_workers=args.threads) as executor:
+        failed_checks = executor.map(
+            lambda runfolder: check_runfolder(runfolder, RFM, args.logfile_count, args.check_level), local_runfolders
+        )
+        for runfolder, failed_check in zip(local_runfolders, failed_checks):
+            logger.info("Processing %s", runfolder.name)
+            # Delete runfolder if it meets the backup criteria
+            if failed_check:
+                logger.warning("%s - %s", runfolder.name, failed_check)
             else:
-                clean_upload_log = RFM.check_upload_log(runfolder)
-                if not clean_upload_log:
-                    logger.warning(f"{runfolder.name} - UPLOAD LOG CONTAINS ERRORS")        
+                runfolders_to_delete.append(runfolder)
+    for runfolder in runfolders_to_delete:
+        RFM.delete(runfolder)
+
+    # Record runfolders removed by this iteration
+    logger.info("Runfolders deleted in this instance: %s", sorted(RFM.deleted))
+    logger.info("END")
+
 
-# Record runfolders removed by this iteration
-logger.info(f"Runfolders deleted in this instance: {RFM.deleted}")
-logger.info(f"END")
+if __name__ == "__main__":
+    main()
@@ -7,17 +7,36 @@ Version: 1.0
 Timestamp: 30/05/19
 """
 
+import atexit
 import logging
+import queue
+import sys
 from logging.config import dictConfig
+from logging.handlers import QueueHandler, QueueListener
+
+# Handlers that write from a background listener thread instead of the thread making the log call
+QUEUED_HANDLERS = ("buffered_file_handler", "stream_handler", "syslog_handler")
+# Set once log_setup has run, so later calls do not add a second set of handlers and listener
+_configured = False
 
 
 def log_setup(logfile_path, syslog="/dev/log"):
     """Setup application logging using python's standard library logging module
 
+    Records for the handlers in QUEUED_HANDLERS are put on a queue and written by a QueueListener,
+    so log calls do not block on file, console or syslog writes. The listener is stopped at exit, which
+    flushes any queued records. Only DEBUG logfile writes are buffered. The buffer is flushed every 1024
+    records, on any INFO or above, and at exit, so INFO records such as deletions are written straight
+    away. The console handler is only used when stderr is a terminal.
+    Logging is only configured on the first call; later calls return without changing it.
+
     Args:
         logfile_name(str): The name of the output logfile written to by the file handler
         syslog(str): Output target for the system log handler
     """
+    global _configured
+    if _configured:
+        return
     logging_config = dict(
         version=1.0,
         formatters={
@@ -28,9 +47,9 @@ def log_setup(logfile_path, syslog="/dev/log"):
             }
         },
         handlers={
-            # DEBUG message are ommitted from the console output by setting the stream handler level
-            # to INFO, making console outputs easier to read. DEBUG messages are still written to
-            # the application logfile and system log.
+            # DEBUG message are ommitted from the console and system log outputs by setting their
+            # handler levels to INFO, making these outputs easier to read. DEBUG messages are still
+            # written to the application logfile.
             "stream_handler": {
                 "class": "logging.StreamHandler",
                 "formatter": "log_formatter",
@@ -42,20 +61,47 @@ def log_setup(logfile_path, syslog="/dev/log"):
                 "level": logging.DEBUG,
                 "filename": logfile_path,
             },
+            "buffered_file_handler": {
+                "class": "logging.handlers.MemoryHandler",
+                "level": logging.DEBUG,
+                "capacity": 1024,
+                "flushLevel": logging.INFO,
+                "target": "file_handler",
+            },
             "syslog_handler": {
                 "class": "logging.handlers.SysLogHandler",
                 "formatter": "log_formatter",
-                "level": logging.DEBUG,
+                "level": logging.INFO,
                 "address": syslog,
             },
         },
+        # The wscleaner module and class loggers are created on import, before this configuration. Naming the
+        # parent logger keeps them enabled, while other existing loggers (e.g. dxpy, urllib3) are disabled.
+        loggers={
+            "wscleaner": {"level": logging.DEBUG},
+        },
         root={
-            "handlers": ["file_handler", "stream_handler", "syslog_handler"],
+            "handlers": ["buffered_file_handler", "syslog_handler"],
             "level": logging.DEBUG,
         },
     )
+    # Console output is only useful when a person is watching, e.g. not when run from cron
+    if sys.stderr.isatty():
+        logging_config["root"]["handlers"].append("stream_handler")
     dictConfig(logging_config)
 
+    # Swap the queued handlers on the root logger for a single QueueHandler feeding the listener
+    root_logger = logging.getLogger()
+    queued_handlers = [handler for handler in root_logger.handlers if handler.name in QUEUED_HANDLERS]
+    for handler in queued_handlers:
+        root_logger.removeHandler(handler)
+    log_queue = queue.Queue(-1)
+    root_logger.addHandler(QueueHandler(log_queue))
+    listener = QueueListener(log_queue, *queued_handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    _configured = True
+
 
 if __name__ == "__main__":
     log_setup()
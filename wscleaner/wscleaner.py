@@ -12,6 +12,8 @@ import re
 import logging
 import shutil
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from pathlib import Path
 import os
 import dxpy
@@ -26,6 +28,90 @@ upload_runfolder_logdir = os.path.join(
     "automate_demultiplexing_logfiles",
     "upload_runfolder_script_logfiles",
 )
+# Maximum number of runfolder names combined into a single DNAnexus project search
+PROJECT_SEARCH_BATCH_SIZE = 50
+# Runfolders start with 6 digits
+RUNFOLDER_PATTERN = re.compile("^[0-9]{6}")
+# Start of the last line of bcl2fastq2_output.log written by the automated scripts for TSO500 runs
+TSO500_MARKER = b"TSO500 run."
+
+
+def _scandir_fastqs(path):
+    """Yield the names of files with the 'fastq.gz' extension in a directory tree.
+    The tree is walked with os.scandir, which reads each entry's file type from the directory listing
+    rather than with a stat call per file. Symlinked directories are not followed, and directories that
+    cannot be listed (e.g. unreadable, or removed during the walk) are skipped.
+    Args:
+        path(str): Root directory of the tree
+    """
+    directories = [os.fspath(path)]
+    while directories:
+        directory = directories.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        directories.append(entry.path)
+                    elif entry.name.endswith(".fastq.gz") and entry.is_file():
+                        yield entry.name
+        except OSError as error:
+            logger.debug(f"Skipping {directory} while searching for fastqs: {error}")
+
+
+def _read_last_line(filepath, block_size=1024):
+    """Returns the last line of a file, reading blocks backwards from the end rather than reading the whole file.
+    Args:
+        filepath(str): Path of the file to read
+        block_size(int): Number of bytes read from the file at a time
+    Returns:
+        bytes: The last line of the file, including any line ending. Empty if the file is empty.
+    """
+    with open(filepath, "rb") as f:
+        position = f.seek(0, os.SEEK_END)
+        buffer = b""
+        # Read until the buffer also holds the line ending before the last line, or the start of the file
+        while position > 0 and buffer.count(b"\n") < 2:
+            step = min(block_size, position)
+            position -= step
+            f.seek(position)
+            buffer = f.read(step) + buffer
+    lines = buffer.splitlines(keepends=True)
+    return lines[-1] if lines else b""
+
+
+def _parallel_rmtree(path, workers=8):
+    """Delete a directory tree, unlinking files from a thread pool rather than one at a time.
+    Symlinks within the tree are removed, not followed. If a removal fails, shutil.rmtree is used to remove
+    what remains.
+    Args:
+        path(str): Root directory of the tree
+        workers(int): Number of files to unlink concurrently
+    Raises:
+        OSError: path is a symlink. As with shutil.rmtree, nothing is deleted.
+    """
+    # Never walk into the target of a symlinked root
+    if os.path.islink(path):
+        raise OSError(f"Cannot delete a symbolic link: {path}")
+    files = []
+    directories = []
+    to_scan = [os.fspath(path)]
+    try:
+        while to_scan:
+            directory = to_scan.pop()
+            directories.append(directory)
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        to_scan.append(entry.path)
+                    else:
+                        files.append(entry.path)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(os.unlink, files))
+        # Each directory is listed after its parent, so remove them in reverse order
+        for directory in reversed(directories):
+            os.rmdir(directory)
+    except OSError:
+        shutil.rmtree(path)
 
 
 class RunFolder:
@@ -33,29 +119,51 @@ class RunFolder:
 
     Arguments:
         path (str): The path of a local directory
+        dx_project (DxProjectRunFolder): A DX Project object found in advance. If None, DNAnexus is searched
+            when the dx_project attribute is first used.
+        stat_result (os.stat_result): The directory's stat result, if already known. If None, the path is stat'ed.
     Attributes:
         path (Pathlib.Path): A path object created from the input directory
         name (str): The runfolder/directory name
-        dx_project (DxProjectRunfolder): A DX Project object
+        dx_project (DxProjectRunfolder): A DX Project object, cached after the first lookup
         age (int): Age of the runfolder in days
     Methods:
         find_fastqs: Returns a list of local files with the 'fastq.gz' extension
+        has_fastqs: Returns True if the runfolder contains at least one file with the 'fastq.gz' extension
     """
 
-    def __init__(self, path):
-        self.logger = logging.getLogger("wscleaner.RunFolder")
+    logger = logging.getLogger("wscleaner.RunFolder")
+
+    def __init__(self, path, dx_project=None, stat_result=None):
         self.path = Path(path)
-        self.RTA_complete_exists = os.path.isfile(
-            os.path.join(self.path, "RTAComplete.txt")
-        )
+        # The path as a string is used for filesystem calls, rather than converting the Path object on each call
+        self._path_str = os.fspath(path)
+        self._stat = stat_result if stat_result is not None else os.stat(self._path_str)
         self.name = self.path.name
+        # Names of files at the top level of the runfolder, listed once for the RTAComplete and TSO500 checks.
+        # A directory that cannot be listed has no files, so is not treated as a runfolder.
+        try:
+            with os.scandir(self._path_str) as entries:
+                self._top_level_files = frozenset(entry.name for entry in entries if entry.is_file())
+        except OSError as error:
+            self.logger.debug(f"{self.name} could not be listed: {error}")
+            self._top_level_files = frozenset()
+        self.RTA_complete_exists = "RTAComplete.txt" in self._top_level_files
+        # Sorted fastq names, set by the first find_fastqs() call so the runfolder is only walked once
+        self._fastq_filenames = None
         self.logger.debug(f"Initiating RunFolder instance for {self.name}")
-        self.dx_project = DxProjectRunFolder(self.name)
+        if dx_project is not None:
+            self.dx_project = dx_project
+
+    @cached_property
+    def dx_project(self):
+        """Returns the DNAnexus project for the runfolder. Searched for once, on first access."""
+        return DxProjectRunFolder(self.name)
 
     @property
     def age(self):
         """Returns runfolder age in days"""
-        age_in_seconds = time.time() - self.path.stat().st_mtime
+        age_in_seconds = time.time() - self._stat.st_mtime
         age_in_days = age_in_seconds // (24 * 3600)
         self.logger.debug(f"{self.name} age is {age_in_days}")
         return age_in_days
@@ -65,11 +173,10 @@ class RunFolder:
         Args:
             count(bool): Returns number of fastqs if True.
         """
-        # Find paths of files with fastq.gz extension
-        fastq_paths = self.path.rglob("*.fastq.gz")
-        # Sort fastq filenames for cleaner logfile outputs
-        fastq_filenames_unsorted = [path.name for path in fastq_paths]
-        fastq_filenames = sorted(fastq_filenames_unsorted)
+        if self._fastq_filenames is None:
+            # Sort fastq filenames for cleaner logfile outputs
+            self._fastq_filenames = sorted(_scandir_fastqs(self._path_str))
+        fastq_filenames = self._fastq_filenames
         # Return number of fastqs if count is True, otherwise return fastq file names
         if count:
             self.logger.debug(
@@ -78,10 +185,18 @@ class RunFolder:
             return len(fastq_filenames)
         else:
             self.logger.debug(
-                f"{self.name} contains {len(fastq_filenames)} fastq files: {fastq_filenames}"
+                "%s contains %s fastq files: %s", self.name, len(fastq_filenames), fastq_filenames
             )
             return fastq_filenames
 
+    def has_fastqs(self):
+        """Returns True if the runfolder contains at least one file with the 'fastq.gz' extension.
+        The walk stops at the first fastq found, unless the full list has already been found by find_fastqs().
+        """
+        if self._fastq_filenames is not None:
+            return bool(self._fastq_filenames)
+        return any(True for _ in _scandir_fastqs(self._path_str))
+
     def TSO500_check(self):
         """
         Checks if the run is a TSO500 run. These need to be cleaned up but do not contain fastqs
@@ -89,25 +204,24 @@ class RunFolder:
         """
         project_name = False
         logfile_check = False
-        bcl2fastq_filepath = os.path.join(self.path, "bcl2fastq2_output.log")
+        bcl2fastq_filepath = os.path.join(self._path_str, "bcl2fastq2_output.log")
         # ensure not trying to open files that don't exist
-        if os.path.isdir(self.path) and os.path.exists(bcl2fastq_filepath):
-            # open bcl2fastq file - should contain a standard statement from automated scripts
-            with open(bcl2fastq_filepath) as demultiplexing_file:
-                # take last line of the logfile - look for statement produced by automated scripts for TSO runs
-                if demultiplexing_file.readlines()[-1].startswith("TSO500 run."):
-                    logfile_check = True
-                    self.logger.info(
-                        f"{self.name} - bcl2fastq2_output.log contains the string expected for TSO500 runs"
-                    )
-                else:
-                    self.logger.debug(
-                        f"{self.name} - bcl2fastq2_output.log DOES NOT contain expected TSO500 string"
-                    )
+        if "bcl2fastq2_output.log" in self._top_level_files:
+            # bcl2fastq file should contain a standard statement from automated scripts
+            # take last line of the logfile - look for statement produced by automated scripts for TSO runs
+            if _read_last_line(bcl2fastq_filepath).startswith(TSO500_MARKER):
+                logfile_check = True
+                self.logger.info(
+                    f"{self.name} - bcl2fastq2_output.log contains the string expected for TSO500 runs"
+                )
+            else:
+                self.logger.debug(
+                    f"{self.name} - bcl2fastq2_output.log DOES NOT contain expected TSO500 string"
+                )
             # May be an issue identifying the DNAnexus project
             # get the dnanexus project name to assess if contains "_TSO"
             if self.dx_project.id:
-                nexus_project_name = dxpy.describe(self.dx_project.id)["name"]
+                nexus_project_name = self.dx_project.name
                 if "_TSO" in nexus_project_name:
                     self.logger.debug(
                         f'DNANexus project name {nexus_project_name} contains the string "_TSO"'
@@ -127,42 +241,78 @@ class DxProjectRunFolder:
 
     Arguments:
         runfolder_name (str): The name of a local runfolder
+        projects (list): DNAnexus projects already found for the runfolder by find_projects().
+            If None, DNAnexus is searched for this runfolder alone.
     Attributes:
         runfolder (str): Runfolder name
         id (str): Project ID of the matching runfolder project in DNANexus.
+        name (str): Name of the matching runfolder project in DNAnexus, returned with the project search.
     Methods:
+        find_projects: Find the DNAnexus projects for many runfolders with a single search per batch
         find_fastqs: Returns a list of files in the DNAnexus project (self.id) with the fastq.gz extension
         count_logfiles: Count logfiles in the DNAnexus project (self.id). Logfiles are in an expected location
     """
 
-    def __init__(self, runfolder_name):
-        self.logger = logging.getLogger("wscleaner.DXProjectRunFolder")
+    logger = logging.getLogger("wscleaner.DXProjectRunFolder")
+
+    def __init__(self, runfolder_name, projects=None):
         self.runfolder = runfolder_name
-        self.id = self.__dx_find_one_project()
+        if projects is None:
+            project = self.__dx_find_one_project()
+        else:
+            project = self.__select_one_project(projects)
+        self.id = project["id"] if project else None
+        self.name = project["describe"]["name"] if project else None
+
+    @classmethod
+    def find_projects(cls, runfolder_names):
+        """Find the DNAnexus projects for many runfolders, searching for up to PROJECT_SEARCH_BATCH_SIZE
+        runfolder names in each request rather than one request per runfolder.
+
+        Args:
+            runfolder_names (list): Local runfolder names
+        Returns:
+            dict: DxProjectRunFolder objects keyed by runfolder name
+        """
+        matches = {name: [] for name in runfolder_names}
+        for start in range(0, len(runfolder_names), PROJECT_SEARCH_BATCH_SIZE):
+            batch = runfolder_names[start:start + PROJECT_SEARCH_BATCH_SIZE]
+            # name_mode='regexp' - return projects containing any of the runfolder names in the project name.
+            # Each project is then assigned to the runfolder names it contains.
+            search_response = dxpy.find_projects(
+                name="|".join(batch), name_mode="regexp", describe={"fields": {"name": True}}
+            )
+            for project in search_response:
+                for name in batch:
+                    if re.search(name, project["describe"]["name"]):
+                        matches[name].append(project)
+        return {name: cls(name, projects=projects) for name, projects in matches.items()}
 
     def find_fastqs(self):
         """Returns a list of files in the DNAnexus project (self.id) with the fastq.gz extension"""
-        # Search dnanexus for files with the fastq.gz extension.
+        # Search dnanexus for uploaded files with the fastq.gz extension.
         # name_mode='regexp' tells dxpy to look for any occurence of 'fastq.gz' in the filename
+        # state='closed' returns only files that have completed upload
+        # Each file's name is returned with the search results, rather than describing files one by one
         search_response = dxpy.find_data_objects(
-            project=self.id, classname="file", name="fastq.gz", name_mode="regexp"
+            project=self.id,
+            classname="file",
+            name="fastq.gz",
+            name_mode="regexp",
+            state="closed",
+            describe={"fields": {"name": True}},
         )
-        file_ids = [result["id"] for result in search_response]
-        # Gather a list of uploaded fastq files with the state 'closed', indicating a completed upload.
-        fastq_filenames_unsorted = []
-        for dx_file in file_ids:
-            file_description = dxpy.describe(dx_file)
-            if file_description["state"] == "closed":
-                fastq_filenames_unsorted.append(file_description["name"])
         # Sort fastq filenames for cleaner logfile output
-        fastq_filenames = sorted(fastq_filenames_unsorted)
+        fastq_filenames = sorted(result["describe"]["name"] for result in search_response)
         self.logger.debug(
-            f'{self.id} contains {len(fastq_filenames)} "closed" fastq files: {fastq_filenames}'
+            '%s contains %s "closed" fastq files: %s', self.id, len(fastq_filenames), fastq_filenames
         )
         return fastq_filenames
 
-    def count_logfiles(self):
+    def count_logfiles(self, limit=None):
         """Count logfiles in the DNAnexus project (self.id). Logfiles are in an expected location.
+        Args:
+            limit (int): Maximum number of logfiles to count. If None, all logfiles are counted.
         Returns:
             logfile_count (int): A count of logfiles"""
         # Set logfile location in DNANexus project. This is expected in 'automated_scripts_logfiles/', a subdirectory of the uploaded runfolder
@@ -170,7 +320,7 @@ class DxProjectRunFolder:
             os.path.join("/", self.runfolder, "automated_scripts_logfiles")
         )
         logfile_list = dxpy.find_data_objects(
-            project=self.id, folder=logfile_dir, classname="file"
+            project=self.id, folder=logfile_dir, classname="file", limit=limit
         )
         return len(list(logfile_list))
 
@@ -178,22 +328,43 @@ class DxProjectRunFolder:
         """Find a single DNAnexus project from the input runfolder name
 
         Returns:
-            A DNAnexus project ID. If the search fails, returns None.
+            A DNAnexus project search result, including the project name. If the search fails, returns None.
         """
         try:
             # Search for the project matching self.runfolder.
             # name_mode='regexp' - look for any occurence of the runfolder name in the project name.
             # Setting more_ok/zero_ok to False ensures only one project is succesfully returned.
             project = dxpy.find_one_project(
-                name=self.runfolder, name_mode="regexp", more_ok=False, zero_ok=False
+                name=self.runfolder,
+                name_mode="regexp",
+                more_ok=False,
+                zero_ok=False,
+                describe={"fields": {"name": True}},
             )
             self.logger.debug(f'{self.runfolder} DNAnexus project: {project["id"]}')
-            return project["id"]
+            return project
         except dxpy.exceptions.DXSearchError as error:
             # Catch exception and raise none
             self.logger.warning(f"DX PROJECT MISMATCH - 0 or >1 DNAnexus projects found for {self.runfolder}: {error}")
             return None
 
+    def __select_one_project(self, projects):
+        """Select the single DNAnexus project found for the runfolder by find_projects()
+
+        Returns:
+            A DNAnexus project search result, including the project name. If zero or more than one project
+            was found, returns None.
+        """
+        if len(projects) == 1:
+            self.logger.debug(f'{self.runfolder} DNAnexus project: {projects[0]["id"]}')
+            return projects[0]
+        # Logged at debug as the failed check is reported as a warning when the runfolder is checked
+        self.logger.debug(
+            f"DX PROJECT MISMATCH - {len(projects)} DNAnexus projects found for {self.runfolder}: "
+            f"{[project['describe']['name'] for project in projects]}"
+        )
+        return None
+
     def __bool__(self):
         """Allows boolean expressions on class instances which return True if a single DNAnexus project was found."""
         if self.id:
@@ -217,15 +388,16 @@ class RunFolderManager:
         check_fastqs(): Returns true if a runfolder's fastq.gz files match those in it's DNAnexus project.
         check_logfiles(): Returns true if a runfolder's DNAnexus project contains 6 logfiles in the
             expected location
-        upload_log_exists(): Returns true if a runfolder's upload log exists
-        check_upload_log(): Returns true if a runfolder's upload log contains no upload errors
+        check_upload_log(): Returns true if a runfolder's upload log contains no upload errors, or None if the
+            upload log does not exist
         delete(): Delete the local runfolder from the root directory and append name to self.deleted.
     Raises:
         __validate():ValueError: The directory passed to the class instance does not exist.
     """
 
+    logger = logging.getLogger("wscleaner.RunFolderManager")
+
     def __init__(self, directory, dry_run=False):
-        self.logger = logging.getLogger("wscleaner.RunFolderManager")
         self.__validate(directory)
         self.runfolder_dir = Path(directory)
         self.__dry_run = dry_run
@@ -239,58 +411,84 @@ class RunFolderManager:
             self.logger.error(f"Directory does not exist: {directory}", exc_info=True)
             raise
 
-    def find_runfolders(self, min_age=None):
+    def find_runfolders(self, min_age=None, threads=16):
         """Search the parent directory for subdirectories containing fastq.gz files.
         Args:
             min_age(int): Minimum age in days of runfolders returned.
+            threads(int): Number of directories to evaluate concurrently. Listing each runfolder and searching it
+                for fastqs wait on IO.
         Returns:
             runfolder_objects(list): List of wscleaner.lib.RunFolder objects.
         """
-        runfolder_objects = []
-        directory_list = [directory for directory in self.runfolder_dir.iterdir() if directory.is_dir()]
-        # Sort subdirectories by last modified date
-        directory_list.sort(key=lambda subdir: subdir.stat().st_mtime)
-        # list all directories in the runfolder dir.
-        for directory in directory_list:
-            if re.compile("^[0-9]{6}.*$").match(directory.name):  # Runfolders start with 6 digits
-                rf = RunFolder(directory)
-                # skip any folders that do not have an RTAComplete.txt file
-                if not rf.RTA_complete_exists:
-                    self.logger.debug(
-                        f"{rf.name} is not a runfolder, or sequencing has not yet finished."
-                    )
-                else:
-                    # catch TSO500 runfolders here (do not contain fastqs)
-                    if (rf.age >= min_age) and (rf.TSO500_check()):
-                        self.logger.debug(
-                            f"{rf.name} is a TSO500 runfolder and is >= {min_age} days old."
-                        )
-                        runfolder_objects.append(rf)
-                    # Criteria for runfolder: Older than or equal to min_age and contains fastq.gz files
-                    elif (rf.age >= min_age) and (rf.find_fastqs(count=True) > 0):
-                        self.logger.debug(
-                            f"{rf.name} contains 1 or more fastq and is >= {min_age} days old."
-                        )
-                        runfolder_objects.append(rf)
-                    # shouldn't get this far anymore - leave in just incase.
-                    else:
-                        self.logger.debug(
-                            f"{rf.name} has 0 fastqs, is not a TSO runfolder or is < {min_age} days old."
-                        )
-        return runfolder_objects
+        # Symlinks to directories are not runfolders in the parent directory, so are not followed
+        with os.scandir(self.runfolder_dir) as entries:
+            directory_list = [entry for entry in entries if entry.is_dir(follow_symlinks=False)]
+        # Sort subdirectories by last modified date. DirEntry caches its stat result, which is reused by RunFolder
+        directory_list.sort(key=lambda entry: entry.stat().st_mtime)
+        # list all directories in the runfolder dir that are named like runfolders
+        directory_list = [directory for directory in directory_list if RUNFOLDER_PATTERN.match(directory.name)]
+        # Results are returned in directory order
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            runfolders = executor.map(
+                lambda directory: RunFolder(directory.path, stat_result=directory.stat()), directory_list
+            )
+            # Only completed runfolders old enough to delete need a DNAnexus project
+            runfolders = [rf for rf in runfolders if self._is_eligible(rf, min_age)]
+            # Find the DNAnexus projects for all eligible runfolders together rather than with one search per runfolder
+            dx_projects = DxProjectRunFolder.find_projects([rf.name for rf in runfolders])
+            for rf in runfolders:
+                rf.dx_project = dx_projects[rf.name]
+            has_data = executor.map(lambda rf: self._has_data(rf, min_age), runfolders)
+            return [rf for rf, rf_has_data in zip(runfolders, has_data) if rf_has_data]
+
+    def _is_eligible(self, rf, min_age):
+        """Returns True if the runfolder has finished sequencing and is older than or equal to min_age.
+        Args:
+            rf(RunFolder): A runfolder in the parent directory
+            min_age(int): Minimum age in days of runfolders returned.
+        """
+        # skip any folders that do not have an RTAComplete.txt file
+        if not rf.RTA_complete_exists:
+            self.logger.debug(
+                f"{rf.name} is not a runfolder, or sequencing has not yet finished."
+            )
+            return False
+        if rf.age < min_age:
+            self.logger.debug(f"{rf.name} is < {min_age} days old.")
+            return False
+        return True
+
+    def _has_data(self, rf, min_age):
+        """Returns True if the runfolder is a TSO500 runfolder or contains fastq.gz files.
+        Args:
+            rf(RunFolder): A runfolder that has finished sequencing and is older than or equal to min_age
+            min_age(int): Minimum age in days of runfolders returned.
+        """
+        # catch TSO500 runfolders here (do not contain fastqs)
+        if rf.TSO500_check():
+            self.logger.debug(
+                f"{rf.name} is a TSO500 runfolder and is >= {min_age} days old."
+            )
+            return True
+        # Criteria for runfolder: Older than or equal to min_age and contains fastq.gz files
+        if rf.has_fastqs():
+            self.logger.debug(
+                f"{rf.name} contains 1 or more fastq and is >= {min_age} days old."
+            )
+            return True
+        self.logger.debug(f"{rf.name} has 0 fastqs and is not a TSO runfolder.")
+        return False
 
     def check_fastqs(self, runfolder):
         """
         Returns true if a runfolder's fastq.gz files match those in it's DNAnexus project.
         Ensures all fastqs were uploaded.
         """
-        dx_fastqs = runfolder.dx_project.find_fastqs()
-        local_fastqs = runfolder.find_fastqs()
-        fastq_bool = True
-        for fastq in local_fastqs:
-            if fastq not in dx_fastqs:
-                self.logger.debug(f"Fastq missing from DNAnexus project: {fastq}")
-                fastq_bool = False
+        dx_fastqs = set(runfolder.dx_project.find_fastqs())
+        missing_fastqs = set(runfolder.find_fastqs()) - dx_fastqs
+        for fastq in sorted(missing_fastqs):
+            self.logger.debug(f"Fastq missing from DNAnexus project: {fastq}")
+        fastq_bool = not missing_fastqs
         self.logger.debug(f"{runfolder.name} FASTQ BOOL: {fastq_bool}")
         return fastq_bool
 
@@ -299,34 +497,28 @@ class RunFolderManager:
         logfiles in the expected location.
         logfile_count is defined in the --logfile-count argument provided (default = 5)
         """
-        dx_logfiles = runfolder.dx_project.count_logfiles()
+        # Counting one more than logfile_count is enough to tell if there are too many logfiles
+        dx_logfiles = runfolder.dx_project.count_logfiles(limit=logfile_count + 1)
         logfile_bool = dx_logfiles == logfile_count
         self.logger.debug(f"{runfolder.name} LOGFILE BOOL: {logfile_bool}")
         return logfile_bool
 
-    def upload_log_exists(self, runfolder):
-        """Returns true if a runfolder's upload log file exists"""
-        upload_runfolder_logfile = os.path.join(
-            upload_runfolder_logdir, f"{runfolder.name}_upload_runfolder.log"
-        )
-        if os.path.exists(upload_runfolder_logfile):
-            return True
-        else:
-            self.logger.debug(f"{runfolder.name} upload log file does not exist")
-
     def check_upload_log(self, runfolder):
-        """Returns true if a runfolder's upload log file contains no ERROR logs."""
-        upload_log_bool = False
+        """Returns true if a runfolder's upload log file contains no ERROR logs.
+        Returns None if the upload log file does not exist."""
         upload_runfolder_logfile = os.path.join(
             upload_runfolder_logdir, f"{runfolder.name}_upload_runfolder.log"
         )
-        with open(upload_runfolder_logfile, "r") as f:
-            log_contents = f.readlines()
-        if "- ERROR -" in log_contents:
+        # Open the log directly rather than checking it exists first. Read it line by line, stopping at the first
+        # ERROR log
+        try:
+            with open(upload_runfolder_logfile, "r") as f:
+                upload_log_bool = not any("- ERROR -" in line for line in f)
+        except FileNotFoundError:
+            self.logger.debug(f"{runfolder.name} upload log file does not exist")
+            return None
+        if not upload_log_bool:
             self.logger.debug(f"{runfolder.name} upload log contains errors")
-            upload_log_bool = False
-        else:
-            upload_log_bool = True
         self.logger.debug(f"{runfolder.name} UPLOAD LOG BOOL: {upload_log_bool}")
         return upload_log_bool
 
@@ -336,5 +528,5 @@ class RunFolderManager:
             self.logger.info(f"DRY RUN DELETE {runfolder.name}")
         else:
             self.deleted.append(runfolder.name)
-            shutil.rmtree(runfolder.path)
+            _parallel_rmtree(runfolder.path)
             self.logger.info(f"{runfolder.name} DELETED.")